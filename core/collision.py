@@ -1,44 +1,38 @@
 import pygame
 
-from core.region_base import LiquidRegion
+from core.region_base import LiquidRegion, circle_overlaps_rect
 
 
 def check_player_enemy_collisions(player, enemies):
     """Check if player overlaps any enemy (circle vs square). Apply damage on contact."""
+    pos = player.pos
+    radius = player.radius
     for enemy in enemies:
         if enemy.health <= 0:
             continue
 
-        # Closest point on enemy rect to player center
         half = enemy.size
-        closest_x = max(enemy.pos.x - half, min(player.pos.x, enemy.pos.x + half))
-        closest_y = max(enemy.pos.y - half, min(player.pos.y, enemy.pos.y + half))
-
-        dist_sq = (player.pos.x - closest_x) ** 2 + (player.pos.y - closest_y) ** 2
-
-        if dist_sq < player.radius ** 2:
+        ex, ey = enemy.pos
+        if circle_overlaps_rect(pos, radius, ex - half, ey - half, ex + half, ey + half):
             player.take_damage(enemy.hit_damage, enemy.pos)
 
 
 def resolve_entity_vs_regions(entity, regions):
     """Push entity out of solid regions along shortest overlap axis."""
     r = getattr(entity, "radius", 0)
+    pos = entity.pos  # mutated in place below
 
     for region in regions:
-        if not region.overlaps_circle(entity.pos, r):
+        if not region.overlaps_circle(pos, r):
             continue
 
         # Find overlap on each axis
-        half_w = region.rect.width / 2
-        half_h = region.rect.height / 2
-        cx = region.rect.centerx
-        cy = region.rect.centery
-
-        dx = entity.pos.x - cx
-        dy = entity.pos.y - cy
+        rect = region.rect
+        dx = pos.x - rect.centerx
+        dy = pos.y - rect.centery
 
-        overlap_x = half_w + r - abs(dx)
-        overlap_y = half_h + r - abs(dy)
+        overlap_x = rect.width / 2 + r - abs(dx)
+        overlap_y = rect.height / 2 + r - abs(dy)
 
         if overlap_x <= 0 or overlap_y <= 0:
             continue
@@ -46,14 +40,14 @@ def resolve_entity_vs_regions(entity, regions):
         # Push along shortest axis
         if overlap_x < overlap_y:
             if dx > 0:
-                entity.pos.x += overlap_x
+                pos.x += overlap_x
             else:
-                entity.pos.x -= overlap_x
+                pos.x -= overlap_x
         else:
             if dy > 0:
-                entity.pos.y += overlap_y
+                pos.y += overlap_y
             else:
-                entity.pos.y -= overlap_y
+                pos.y -= overlap_y
 
 
 def apply_region_effects(entity, regions, dt):
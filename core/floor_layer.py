@@ -1,4 +1,4 @@
-from core.region_base import LiquidRegion
+from core.region_base import LiquidRegion, WALL_COLORKEY
 
 
 class FloorLayer:
@@ -8,18 +8,41 @@ class FloorLayer:
         self.floor_regions = []
         self.wall_regions = []
 
+        # Bumped on every change so renderers can tell their caches are stale
+        self.revision = 0
+
+        # Derived region lists, rebuilt lazily after regions are added
+        self._solid_regions = None
+        self._effect_regions = None
+
     def add_floor_region(self, region):
         self.floor_regions.append(region)
+        self._invalidate()
 
     def add_wall_region(self, region):
+        if tuple(region.color[:3]) == WALL_COLORKEY:
+            raise ValueError(
+                f"wall color {region.color} is reserved as the wall colorkey"
+            )
         self.wall_regions.append(region)
+        self._invalidate()
+
+    def _invalidate(self):
+        self.revision += 1
+        self._solid_regions = None
+        self._effect_regions = None
 
     def get_solid_regions(self):
-        return [r for r in self.wall_regions if r.solid] + \
-               [r for r in self.floor_regions if r.solid]
+        if self._solid_regions is None:
+            self._solid_regions = [r for r in self.wall_regions if r.solid] + \
+                                  [r for r in self.floor_regions if r.solid]
+        return self._solid_regions
 
     def get_effect_regions(self):
-        return [r for r in self.floor_regions if isinstance(r, LiquidRegion)]
+        if self._effect_regions is None:
+            self._effect_regions = [r for r in self.floor_regions
+                                    if isinstance(r, LiquidRegion)]
+        return self._effect_regions
 
     def has_floor_at(self, pos, radius):
         """Check if any floor or wall region overlaps the given circle."""
@@ -89,13 +89,20 @@ class HudText(HudElement):
         self.text_source = text_source
         self.color = color
 
+        # Last rendered (text, color) and its surface; re-render only on change
+        self._rendered_key = None
+        self._rendered_surface = None
+
     def draw(self, screen, parent_offset=(0, 0)):
         if not self.visible:
             return
         display_text = self.text_source() if self.text_source else self.text
-        surface = self._font.render(display_text, True, self.color)
+        key = (display_text, self.color)
+        if key != self._rendered_key:
+            self._rendered_surface = self._font.render(display_text, True, self.color)
+            self._rendered_key = key
         pos = self.rel_pos + pygame.Vector2(parent_offset)
-        screen.blit(surface, pos)
+        screen.blit(self._rendered_surface, pos)
 
 
 class HudContainer(HudElement):
@@ -110,6 +117,7 @@ class HudContainer(HudElement):
         super().__init__(position, size)
         self.bg_color = bg_color
         self.children = []
+        self._bg_surface = None
 
     def add(self, element):
         self.children.append(element)
@@ -124,11 +132,12 @@ class HudContainer(HudElement):
             return
         rect = self.get_rect(parent_offset)
 
-        # Draw background with alpha support
+        # Draw background with alpha support (surface cached until size changes)
         if len(self.bg_color) == 4:
-            surf = pygame.Surface((rect.width, rect.height), pygame.SRCALPHA)
-            surf.fill(self.bg_color)
-            screen.blit(surf, (rect.x, rect.y))
+            if self._bg_surface is None or self._bg_surface.get_size() != rect.size:
+                self._bg_surface = pygame.Surface(rect.size, pygame.SRCALPHA)
+                self._bg_surface.fill(self.bg_color)
+            screen.blit(self._bg_surface, (rect.x, rect.y))
         else:
             pygame.draw.rect(screen, self.bg_color, rect)
 
@@ -19,6 +19,14 @@ class Menu:
         self.font = pygame.font.SysFont(None, self.font_size)
         self.item_rects = []
 
+        # Pre-rendered (normal, selected) label surfaces; selection only swaps them
+        self._label_surfaces = [
+            (self.font.render(label, True, self.normal_color),
+             self.font.render(label, True, self.selected_color))
+            for label, _ in self.items
+        ]
+        self._overlay = None
+
     def open(self):
         self.active = True
         self.selected_index = 0
@@ -77,10 +85,11 @@ class Menu:
         if not self.active:
             return
 
-        # Semi-transparent overlay
-        overlay = pygame.Surface(screen.get_size(), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 150))
-        screen.blit(overlay, (0, 0))
+        # Semi-transparent overlay (rebuilt only if the screen size changes)
+        if self._overlay is None or self._overlay.get_size() != screen.get_size():
+            self._overlay = pygame.Surface(screen.get_size(), pygame.SRCALPHA)
+            self._overlay.fill((0, 0, 0, 150))
+        screen.blit(self._overlay, (0, 0))
 
         # Render menu items
         self.item_rects = []
@@ -88,9 +97,8 @@ class Menu:
         total_height = len(self.items) * self.item_spacing
         start_y = (screen_h - total_height) // 2
 
-        for i, (label, _) in enumerate(self.items):
-            color = self.selected_color if i == self.selected_index else self.normal_color
-            text_surface = self.font.render(label, True, color)
+        for i, (normal_surface, selected_surface) in enumerate(self._label_surfaces):
+            text_surface = selected_surface if i == self.selected_index else normal_surface
             rect = text_surface.get_rect(center=(screen_w // 2, start_y + i * self.item_spacing))
             screen.blit(text_surface, rect)
             self.item_rects.append(rect)
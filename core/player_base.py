@@ -35,6 +35,9 @@ class Player:
         self.invuln_freq = stats["invuln_freq"]
         self.invuln_speed = stats["invuln_speed"]
 
+        # Translucent body surfaces for the invuln blink, keyed by body color
+        self._ghost_surfaces = {}
+
         # -----------------------------
         # Stamina
         # -----------------------------
@@ -56,6 +59,7 @@ class Player:
         # -----------------------------
         self.sneak_speed_factor = stats["sneak_speed_factor"]
         self.sneaking = False
+        self.sneak_color = (self.color[0] // 2, self.color[1] // 2, self.color[2] // 2)
 
         # -----------------------------
         # Layer
@@ -211,14 +215,15 @@ class Player:
     # =====================================================
 
     def draw(self, screen, camera):
-        color = self.color
-        if self.sneaking:
-            color = (color[0] // 2, color[1] // 2, color[2] // 2)
+        color = self.sneak_color if self.sneaking else self.color
 
         # Blink transparency while invulnerable
         if self.invuln_timer > 0 and int(self.invuln_timer * self.invuln_freq * 2) % 2 == 0:
-            surf = pygame.Surface((self.radius * 2, self.radius * 2), pygame.SRCALPHA)
-            pygame.draw.circle(surf, (*color, 128), (self.radius, self.radius), self.radius)
+            surf = self._ghost_surfaces.get(color)
+            if surf is None:
+                surf = pygame.Surface((self.radius * 2, self.radius * 2), pygame.SRCALPHA)
+                pygame.draw.circle(surf, (*color, 128), (self.radius, self.radius), self.radius)
+                self._ghost_surfaces[color] = surf
             screen.blit(surf, camera.apply(self.pos) - pygame.Vector2(self.radius, self.radius))
         else:
             pygame.draw.circle(screen, color, camera.apply(self.pos), self.radius)
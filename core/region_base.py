@@ -1,5 +1,24 @@
 import pygame
 
+# Transparent key for the map's cached wall surface; walls may not use it
+WALL_COLORKEY = (255, 0, 255)
+
+
+def circle_overlaps_rect(pos, radius, left, top, right, bottom):
+    """Circle-vs-rect overlap test against the edges of an axis-aligned rect."""
+    x = pos.x
+    y = pos.y
+
+    # Early out: circle's bounding box misses the rect (the common case)
+    if x + radius <= left or x - radius >= right or \
+            y + radius <= top or y - radius >= bottom:
+        return False
+
+    closest_x = max(left, min(x, right))
+    closest_y = max(top, min(y, bottom))
+    dist_sq = (x - closest_x) ** 2 + (y - closest_y) ** 2
+    return dist_sq < radius * radius
+
 
 class MapRegion:
     def __init__(self, rect, region_type, color, solid):
@@ -10,10 +29,9 @@ class MapRegion:
 
     def overlaps_circle(self, pos, radius):
         """Circle-vs-rect overlap test."""
-        closest_x = max(self.rect.left, min(pos.x, self.rect.right))
-        closest_y = max(self.rect.top, min(pos.y, self.rect.bottom))
-        dist_sq = (pos.x - closest_x) ** 2 + (pos.y - closest_y) ** 2
-        return dist_sq < radius ** 2
+        rect = self.rect
+        return circle_overlaps_rect(pos, radius, rect.left, rect.top,
+                                    rect.right, rect.bottom)
 
     def draw(self, screen, camera):
         screen_rect = self.rect.move(camera.offset)
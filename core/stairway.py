@@ -1,6 +1,8 @@
 import pygame
 from enum import Enum
 
+from core.region_base import circle_overlaps_rect
+
 
 class StairDirection(Enum):
     LEFT = "left"
@@ -20,10 +22,9 @@ class Stairway:
 
     def _overlaps(self, entity):
         r = getattr(entity, "radius", 0)
-        closest_x = max(self.rect.left, min(entity.pos.x, self.rect.right))
-        closest_y = max(self.rect.top, min(entity.pos.y, self.rect.bottom))
-        dist_sq = (entity.pos.x - closest_x) ** 2 + (entity.pos.y - closest_y) ** 2
-        return dist_sq < r ** 2
+        rect = self.rect
+        return circle_overlaps_rect(entity.pos, r, rect.left, rect.top,
+                                    rect.right, rect.bottom)
 
     def _past_midpoint(self, entity):
         """Check if entity has crossed the midpoint in the stair direction."""
@@ -1,5 +1,8 @@
 import pygame
 
+from core.camera import Camera
+from core.region_base import WALL_COLORKEY
+
 
 class MapBase:
     def __init__(self, width, height):
@@ -7,19 +10,25 @@ class MapBase:
         self.height = height
         self.enemies = []
         self.floor_layers = []
+        self._layers_by_elevation = {}
         self.stairways = []
+        self._stairways_by_layer = {}  # elevation -> stairways touching it
+
+        # view_layer -> (layer revisions, composited surface)
+        self._background_cache = {}
+        self._walls_cache = {}
 
     def add_layer(self, layer):
         self.floor_layers.append(layer)
+        self._layers_by_elevation.setdefault(layer.elevation, layer)
 
     def add_stairway(self, stairway):
         self.stairways.append(stairway)
+        for elevation in {stairway.from_layer, stairway.to_layer}:
+            self._stairways_by_layer.setdefault(elevation, []).append(stairway)
 
     def get_layer(self, elevation):
-        for layer in self.floor_layers:
-            if layer.elevation == elevation:
-                return layer
-        return None
+        return self._layers_by_elevation.get(elevation)
 
     def clamp_entity(self, entity):
         """Clamp an entity (must have .pos and .radius) within map bounds."""
@@ -41,11 +50,9 @@ class MapBase:
         # Stairways count as floor for both connected layers
         if layer.has_floor_at(entity.pos, r):
             return
-        for stairway in self.stairways:
-            if (stairway.from_layer == entity.current_layer or
-                    stairway.to_layer == entity.current_layer):
-                if stairway._overlaps(entity):
-                    return
+        for stairway in self._stairways_by_layer.get(entity.current_layer, ()):
+            if stairway._overlaps(entity):
+                return
         # No floor or stairway — fall to the next layer below
         best = None
         for candidate in self.floor_layers:
@@ -55,7 +62,7 @@ class MapBase:
         entity.current_layer = best.elevation if best else 0
 
     def check_stairway_transitions(self, entity):
-        for stairway in self.stairways:
+        for stairway in self._stairways_by_layer.get(entity.current_layer, ()):
             result = stairway.check_transition(entity)
             if result is not None:
                 entity.current_layer = result
@@ -64,50 +71,85 @@ class MapBase:
     def draw(self, screen, camera, view_layer=0):
         """Draw all layers from 0 up to view_layer. Layer 0 fills its bg;
         upper layers only draw their regions so lower layers show through gaps.
-        Areas without regions on the current layer are darkened."""
+        Areas without regions on the current layer are darkened.
+
+        The floor layers are static, so they are composited once per view
+        layer into a map-sized surface and blitted; stairways draw live."""
+        background = self._get_cached(
+            self._background_cache, view_layer, self._render_background
+        )
+        map_rect = pygame.Rect(0, 0, self.width, self.height)
+        screen.blit(background, map_rect.move(camera.offset))
+
+        # Draw stairways visible on the current layer
+        for stairway in self._stairways_by_layer.get(view_layer, ()):
+            stairway.draw(screen, camera, view_layer)
+
+    def _get_cached(self, cache, view_layer, render):
+        """Return the cached surface for view_layer, calling
+        render(layers_below, view_layer) if any layer up to view_layer has
+        changed since it was built."""
         layers_below = sorted(
             [l for l in self.floor_layers if l.elevation <= view_layer],
             key=lambda l: l.elevation,
         )
+        revisions = tuple((id(l), l.revision) for l in layers_below)
+
+        cached = cache.get(view_layer)
+        if cached is None or cached[0] != revisions:
+            cached = (revisions, render(layers_below, view_layer))
+            cache[view_layer] = cached
+        return cached[1]
+
+    def _render_background(self, layers_below, view_layer):
+        """Composite layers_below (sorted by elevation) into one surface."""
+        has_base = any(l.elevation == 0 for l in layers_below)
+        surface = pygame.Surface(
+            (self.width, self.height), 0 if has_base else pygame.SRCALPHA
+        )
+        origin = Camera()  # unscrolled, so regions draw in map coordinates
 
         current_layer = None
         for layer in layers_below:
             # Only the bottom layer fills the entire map background
             if layer.elevation == 0:
-                map_rect = pygame.Rect(0, 0, self.width, self.height)
-                screen_rect = map_rect.move(camera.offset)
-                pygame.draw.rect(screen, layer.bg_color, screen_rect)
+                surface.fill(layer.bg_color)
 
             if layer.elevation == view_layer:
                 current_layer = layer
                 continue
 
             for region in layer.floor_regions:
-                region.draw(screen, camera)
+                region.draw(surface, origin)
 
         # Darken lower layers where the current layer has no regions
         if view_layer > 0:
-            map_rect = pygame.Rect(0, 0, self.width, self.height)
-            screen_rect = map_rect.move(camera.offset)
-            dark = pygame.Surface((screen_rect.width, screen_rect.height), pygame.SRCALPHA)
+            dark = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
             dark.fill((0, 0, 0, 100))
-            screen.blit(dark, screen_rect.topleft)
+            surface.blit(dark, (0, 0))
 
         # Draw current layer's floor regions on top at full brightness
         if current_layer:
             for region in current_layer.floor_regions:
-                region.draw(screen, camera)
+                region.draw(surface, origin)
 
-        # Draw stairways visible on the current layer
-        for stairway in self.stairways:
-            stairway.draw(screen, camera, view_layer)
+        return surface
 
     def draw_walls(self, screen, camera, view_layer=0):
-        """Draw wall regions on top of entities for all layers up to view_layer."""
-        layers_below = sorted(
-            [l for l in self.floor_layers if l.elevation <= view_layer],
-            key=lambda l: l.elevation,
-        )
+        """Draw wall regions on top of entities for all layers up to view_layer.
+
+        Walls are composited into a color-keyed surface so each frame is a
+        single blit instead of one draw call per wall."""
+        walls = self._get_cached(self._walls_cache, view_layer, self._render_walls)
+        map_rect = pygame.Rect(0, 0, self.width, self.height)
+        screen.blit(walls, map_rect.move(camera.offset))
+
+    def _render_walls(self, layers_below, view_layer):
+        surface = pygame.Surface((self.width, self.height))
+        surface.fill(WALL_COLORKEY)
+        origin = Camera()  # unscrolled, so regions draw in map coordinates
         for layer in layers_below:
             for region in layer.wall_regions:
-                region.draw(screen, camera)
+                region.draw(surface, origin)
+        surface.set_colorkey(WALL_COLORKEY, pygame.RLEACCEL)
+        return surface
@@ -24,6 +24,7 @@ class Sword:
         self.timer = 0.0
         self.active = False
         self.hit_this_swing = False
+        self.blade_direction = pygame.Vector2(0, -1)
 
         self.afterimages = []
 
@@ -47,6 +48,7 @@ class Sword:
         self.active = True
         self.timer = self.swing_time
         self.hit_this_swing = False
+        self.blade_direction = self.owner.facing.rotate(-self.arc_degrees / 2)
 
         # Play random attack sound if provided
         if self.attack_sounds:
@@ -71,12 +73,13 @@ class Sword:
         # Compute arc angle
         angle = -self.arc_degrees / 2 + progress * self.arc_degrees
         direction = self.owner.facing.rotate(angle)
+        self.blade_direction = direction
 
         tip = self.owner.pos + direction * self.range
 
-        # Store afterimage
+        # Store afterimage (facing is locked mid-swing, so the direction holds)
         self.afterimages.append({
-            "progress": progress,
+            "direction": direction,
             "time": self.afterimage_time
         })
 
@@ -116,13 +119,12 @@ class Sword:
     # =====================================================
 
     def draw(self, screen, camera):
+        # Blade origin doesn't change within a frame
+        start = camera.apply(self.owner.pos)
+
         # Draw afterimages
         for a in self.afterimages:
-            ang = -self.arc_degrees / 2 + a["progress"] * self.arc_degrees
-            d = self.owner.facing.rotate(ang)
-
-            start = camera.apply(self.owner.pos)
-            end = camera.apply(self.owner.pos + d * self.range)
+            end = start + a["direction"] * self.range
 
             pygame.draw.line(
                 screen,
@@ -134,12 +136,7 @@ class Sword:
 
         # Draw active blade
         if self.active:
-            progress = 1 - (self.timer / self.swing_time)
-            ang = -self.arc_degrees / 2 + progress * self.arc_degrees
-            d = self.owner.facing.rotate(ang)
-
-            start = camera.apply(self.owner.pos)
-            end = camera.apply(self.owner.pos + d * self.range)
+            end = start + self.blade_direction * self.range
 
             pygame.draw.line(
                 screen,